@@ -2,6 +2,7 @@
 API эндпоинты для OKX API
 """
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
 from loguru import logger
 from typing import Optional
 
@@ -72,7 +73,7 @@ async def test_connection():
         logger.info("Запрос на тестирование соединения с OKX API")
         
         # Тестирование соединения
-        result = okx_service.test_connection()
+        result = await run_in_threadpool(okx_service.test_connection)
         
         logger.info(f"Результат тестирования: {result['status']}")
         return result
@@ -105,7 +106,8 @@ async def cancel_order(
     try:
         logger.info(f"Запрос на отмену ордера: {request.ordId} (demo: {demo})")
 
-        result = okx_service.cancel_order(
+        result = await run_in_threadpool(
+            okx_service.cancel_order,
             inst_id=request.instId,
             ord_id=request.ordId,
             demo=demo
@@ -171,7 +173,8 @@ async def buy_btc(
         logger.info(f"Запрос на покупку BTC: сумма {request.buy_amount} USDT, TP {request.take_profit_percent}%, SL {request.stop_loss_percent}% (demo: {demo})")
         
         # Выполнение покупки BTC с точками выхода
-        result = okx_service.buy_btc_with_exits(
+        result = await run_in_threadpool(
+            okx_service.buy_btc_with_exits,
             buy_amount=request.buy_amount,
             inst_id=request.inst_id,
             take_profit_percent=request.take_profit_percent,
@@ -220,7 +223,8 @@ async def sell_btc(
     try:
         logger.info(f"Запрос на продажу BTC: {request.sell_amount} BTC (demo: {demo})")
 
-        result = okx_service.sell_btc_market(
+        result = await run_in_threadpool(
+            okx_service.sell_btc_market,
             sell_amount=request.sell_amount,
             inst_id=request.inst_id,
             demo=demo
@@ -266,7 +270,7 @@ async def get_balances(
         logger.info(f"Запрос на получение балансов всех валют (demo: {demo})")
         
         # Получение балансов
-        result = okx_service.get_balances(demo=demo)
+        result = await run_in_threadpool(okx_service.get_balances, demo=demo)
         
         response = BalanceResponse(
             success=result["success"],
@@ -307,7 +311,7 @@ async def get_orders(
     try:
         logger.info(f"Запрос на получение открытых ордеров (demo: {demo})")
 
-        result = okx_service.get_orders(demo=demo)
+        result = await run_in_threadpool(okx_service.get_orders, demo=demo)
 
         response = OrdersResponse(
             success=result["success"],
@@ -363,7 +367,8 @@ async def get_fills(
     try:
         logger.info(f"Запрос на получение последних сделок: inst_type={inst_type}, inst_id={inst_id}, ord_id={ord_id}, limit={limit} (demo: {demo})")
         
-        result = okx_service.get_trade_fills(
+        result = await run_in_threadpool(
+            okx_service.get_trade_fills,
             inst_type=inst_type,
             inst_id=inst_id,
             ord_id=ord_id,
@@ -399,7 +404,8 @@ async def get_fills(
     description="Получает полные аналитические данные по BTC для всех таймфреймов: 1m(120), 5m(144), 15m(96), 1h(72), 4h(90), 1d(90)"
 )
 async def get_market_analytics(
-    demo: bool = Query(default=False, description="Включить демо-режим (true для симуляции, false для реального)")
+    demo: bool = Query(default=False, description="Включить демо-режим (true для симуляции, false для реального)"),
+    force_refresh: bool = Query(default=False, description="Получить свежие данные в обход кэшей аналитики, стакана, тикера и свечей")
 ):
     """
     Получение полных аналитических данных по BTC для всех таймфреймов
@@ -428,7 +434,7 @@ async def get_market_analytics(
         logger.info("Запрос аналитических данных по BTC для всех таймфреймов")
         
         # Получение аналитических данных по всем таймфреймам BTC
-        result = okx_service.get_market_analytics(demo=demo)
+        result = await run_in_threadpool(okx_service.get_market_analytics, demo=demo, cache=not force_refresh)
         
         # Создаем ответ с правильной структурой
         response = AnalyticsResponse(
@@ -485,7 +491,7 @@ async def get_quick_monitor(
         logger.info("Запрос на быстрый мониторинг BTC")
         
         # Получение мониторинговых данных
-        result = okx_service.get_quick_monitor(demo=demo)
+        result = await run_in_threadpool(okx_service.get_quick_monitor, demo=demo)
         
         # Создаем ответ с правильной структурой
         response = MonitorResponse(
@@ -4,6 +4,8 @@ Pydantic схемы для API
 from pydantic import BaseModel, Field
 from typing import Optional
 
+from app.services.okx_service import INST_ID_PATTERN
+
 
 class ErrorResponse(BaseModel):
     """Схема ответа с ошибкой"""
@@ -154,7 +156,8 @@ class BuyRequest(BaseModel):
     inst_id: str = Field(
         default="BTC-USDT",
         description="Инструмент для покупки",
-        example="BTC-USDT"
+        example="BTC-USDT",
+        pattern=INST_ID_PATTERN
     )
     take_profit_percent: float = Field(
         default=5.0,
@@ -4,18 +4,26 @@
 from loguru import logger
 import sys
 
+from app.core.config import settings
+
 
 def setup_logger():
     """Настройка логгера"""
     # Удаляем стандартный обработчик
     logger.remove()
     
+    # Записи передаются в фоновый поток через очередь (enqueue), чтобы запись логов
+    # не блокировала обработку запросов; diagnose отключен, он разбирает локальные переменные
+    
     # Добавляем обработчик для консоли
     logger.add(
         sys.stdout,
         format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
         level="INFO",
-        colorize=True
+        colorize=True,
+        enqueue=True,
+        backtrace=False,
+        diagnose=False
     )
     
     # Добавляем обработчик для файла
@@ -24,8 +32,11 @@ def setup_logger():
         rotation="10 MB",
         retention="7 days",
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
-        level="DEBUG",
-        compression="zip"
+        level="DEBUG" if settings.debug else "INFO",
+        compression="zip",
+        enqueue=True,
+        backtrace=False,
+        diagnose=False
     )
 
 
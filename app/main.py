@@ -5,11 +5,13 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from loguru import logger
+import threading
 import time
 
 from app.core.config import settings
 from app.core.logger import setup_logger
 from app.api.endpoints import router
+from app.services.okx_service import okx_service
 
 
 # Инициализация логгера
@@ -93,6 +95,12 @@ async def global_exception_handler(request: Request, exc: Exception):
     )
 
 
+@app.on_event("startup")
+async def warm_up_okx_connection():
+    """Прогрев соединения с OKX в фоне, чтобы недоступный OKX не задерживал запуск"""
+    threading.Thread(target=okx_service.warm_up_connection, daemon=True).start()
+
+
 # Подключение роутеров
 app.include_router(router, prefix="/api/v1", tags=["OKX API"])
 
@@ -3,16 +3,194 @@
 """
 import time
 import hmac
+import functools
+import inspect
+import re
+import threading
 import base64
 import requests
-from hashlib import sha256
-from typing import Dict, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from loguru import logger
 import json
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
 
 from app.core.config import settings
 
 
+# Предел кэшей подписантов и заголовков: пути с курсорами пагинации уникальны и не должны копиться бесконечно
+_SIGNERS_CACHE_SIZE = 256
+# Предел записей TTL кэша на функцию: ключи строятся из аргументов вызывающего
+_TTL_CACHE_SIZE = 256
+# Исполнение рыночного ордера отражается в accFillSz не мгновенно: несколько коротких повторов
+_FILL_POLL_ATTEMPTS = 4
+_FILL_POLL_DELAY = 0.15
+
+
+@functools.lru_cache(maxsize=128)
+def _build_url(base_url: str, path: str, query: Tuple[Tuple[str, Any], ...] = ()) -> str:
+    """
+    Сборка полного URL запроса с кэшированием для повторяющихся параметров
+    
+    Args:
+        base_url: Базовый URL OKX API
+        path: Путь запроса
+        query: Параметры query string в виде кортежа пар
+        
+    Returns:
+        str: Полный URL
+    """
+    return f"{base_url}{path}?{urlencode(query)}" if query else base_url + path
+
+
+# Допустимые значения, подставляемые в JSON тела ордера без экранирования.
+# INST_ID_PATTERN также используется для проверки inst_id в схемах API
+INST_ID_PATTERN = r"^[A-Z0-9]+(-[A-Z0-9]+)+$"
+_INST_ID_RE = re.compile(INST_ID_PATTERN)
+_ORDER_SIDES = ("buy", "sell")
+
+
+def _validate_order_fields(inst_id: str, side: str) -> None:
+    """
+    Проверка инструмента и стороны перед подстановкой в тело ордера
+    
+    Args:
+        inst_id: Инструмент (например, BTC-USDT)
+        side: Сторона ордера (buy/sell)
+        
+    Raises:
+        ValueError: Если значение нельзя безопасно подставить в JSON
+    """
+    if not isinstance(inst_id, str) or not _INST_ID_RE.match(inst_id):
+        raise ValueError(f"Некорректный инструмент: {inst_id!r}")
+    if side not in _ORDER_SIDES:
+        raise ValueError(f"Некорректная сторона ордера: {side!r}")
+
+
+def _limit_order_body(inst_id: str, side: str, size: float, price: float) -> bytes:
+    """
+    Тело лимитного ордера в компактном JSON, совпадающее байт в байт с json.dumps
+    
+    >>> expected = {"instId": "BTC-USDT", "tdMode": "cash", "side": "sell", "ordType": "limit",
+    ...             "sz": "0.00123400", "px": "52500"}
+    >>> _limit_order_body("BTC-USDT", "sell", 0.001234, 52500) == json.dumps(expected, separators=(",", ":")).encode()
+    True
+    >>> _limit_order_body('BTC-USDT","x":"1', "sell", 0.001, 1)
+    Traceback (most recent call last):
+    ...
+    ValueError: Некорректный инструмент: 'BTC-USDT","x":"1'
+    """
+    _validate_order_fields(inst_id, side)
+    return (
+        f'{{"instId":"{inst_id}","tdMode":"cash","side":"{side}","ordType":"limit",'
+        f'"sz":"{size:.8f}","px":"{price}"}}'
+    ).encode('utf-8')
+
+
+def _stop_loss_order_body(inst_id: str, size: float, trigger_price: float) -> bytes:
+    """
+    Тело trigger-ордера Stop Loss в компактном JSON, совпадающее байт в байт с json.dumps
+    
+    >>> expected = {"instId": "BTC-USDT", "tdMode": "cash", "side": "sell", "ordType": "trigger",
+    ...             "triggerPx": "49000", "triggerPxType": "last", "orderPx": "49000", "sz": "0.00123400"}
+    >>> _stop_loss_order_body("BTC-USDT", 0.001234, 49000) == json.dumps(expected, separators=(",", ":")).encode()
+    True
+    """
+    _validate_order_fields(inst_id, "sell")
+    return (
+        f'{{"instId":"{inst_id}","tdMode":"cash","side":"sell","ordType":"trigger",'
+        f'"triggerPx":"{trigger_price}","triggerPxType":"last","orderPx":"{trigger_price}",'
+        f'"sz":"{size:.8f}"}}'
+    ).encode('utf-8')
+
+
+def _is_cacheable(value: Any) -> bool:
+    """
+    Проверка, что результат успешный и его можно кэшировать
+    
+    Ошибки не кэшируются, иначе один сбой отдавался бы всем вызывающим весь TTL.
+    
+    Args:
+        value: Результат функции
+        
+    Returns:
+        bool: True для успешного ответа
+    """
+    if not isinstance(value, dict):
+        return True
+    if "error" in value:
+        return False
+    # Обертки стакана, свечей и тикера: {"success": bool, ...}
+    if "success" in value and value["success"] is not True:
+        return False
+    return value.get("code", "0") == "0"
+
+
+def _ttl_cache(seconds: float) -> Callable:
+    """
+    Кэширование результата функции на заданное время
+    
+    Ключ кэша строится по аргументам вызова. Исключения и ответы с ошибкой не кэшируются.
+    Число записей ограничено _TTL_CACHE_SIZE: сначала удаляются устаревшие, затем самые старые.
+    Возвращаемые значения общие для всех вызывающих и не должны изменяться.
+    Аргумент cache=False при вызове обходит кэш (например, для торговых решений),
+    а свежий результат сохраняется для следующих вызовов. Если функция сама принимает
+    параметр cache, он передается ей, чтобы обход распространялся на вложенные кэши.
+    Одновременные промахи по одному ключу объединяются: запрос выполняет один поток,
+    остальные ждут и получают его результат.
+    
+    Args:
+        seconds: Время жизни записи в секундах
+        
+    Returns:
+        Callable: Декоратор
+    """
+    def decorator(func: Callable) -> Callable:
+        entries: Dict[Tuple, Tuple[float, Any]] = {}
+        locks: Dict[Tuple, threading.Lock] = {}
+        locks_guard = threading.Lock()
+        pass_cache = 'cache' in inspect.signature(func).parameters
+        
+        @functools.wraps(func)
+        def wrapper(*args, cache: bool = True, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            entry = entries.get(key)
+            if cache and entry is not None and time.monotonic() - entry[0] < seconds:
+                return entry[1]
+            
+            with locks_guard:
+                lock = locks.get(key)
+                if lock is None:
+                    if len(locks) >= _TTL_CACHE_SIZE:
+                        # Свободные блокировки не нужны: их пересоздаст следующий промах
+                        for stale_key in [k for k, l in locks.items() if not l.locked()]:
+                            del locks[stale_key]
+                    lock = locks[key] = threading.Lock()
+            with lock:
+                # Пока ждали блокировку, значение мог получить другой поток
+                entry = entries.get(key)
+                now = time.monotonic()
+                if cache and entry is not None and now - entry[0] < seconds:
+                    return entry[1]
+                value = func(*args, cache=cache, **kwargs) if pass_cache else func(*args, **kwargs)
+                if _is_cacheable(value):
+                    with locks_guard:
+                        entries.pop(key, None)
+                        entries[key] = (now, value)
+                        if len(entries) > _TTL_CACHE_SIZE:
+                            for stale_key in [k for k, (ts, _) in entries.items() if now - ts >= seconds]:
+                                del entries[stale_key]
+                            while len(entries) > _TTL_CACHE_SIZE:
+                                del entries[next(iter(entries))]
+                return value
+        
+        return wrapper
+    return decorator
+
+
 class OKXService:
     """Сервис для работы с OKX API"""
     
@@ -22,6 +200,25 @@ class OKXService:
         self.api_secret = settings.okx_api_secret
         self.passphrase = settings.okx_passphrase
         
+        # Учетные данные не меняются, поэтому нормализуем их один раз
+        self._api_key = (self.api_key or "").strip()
+        self._passphrase = (self.passphrase or "").strip()
+        self._base_headers = {
+            'OK-ACCESS-KEY': self._api_key,
+            'OK-ACCESS-PASSPHRASE': self._passphrase,
+            'Content-Type': 'application/json'
+        }
+        
+        # Секрет кодируется один раз; HMAC с уже вычисленными ipad/opad копируется для каждой подписи
+        self._api_secret_bytes = (self.api_secret or "").encode('utf-8')
+        self._hmac_template = hmac.new(self._api_secret_bytes, digestmod='sha256')
+        # Подписанты кэшируются по (method, path)
+        self._signers: Dict[Tuple[str, str], Callable[[bytes, bytes], bytes]] = {}
+        # (секунда epoch, строка вида 2025-07-25T12:30:45) для повторного использования внутри секунды
+        self._ts_cache: Tuple[int, str] = (0, "")
+        # Заголовки идемпотентных GET запросов переиспользуются в пределах одной секунды
+        self._get_headers_cache: Dict[Tuple[str, bool], Tuple[int, Dict[str, str]]] = {}
+        
         # Настройка сессии requests для лучшей производительности
         self.session = requests.Session()
         self.session.headers.update({
@@ -29,6 +226,25 @@ class OKXService:
             'Accept': 'application/json',
             'Content-Type': 'application/json'
         })
+        
+        # Увеличенный пул соединений, чтобы параллельные запросы не открывали новые TCP+TLS.
+        # Повторы только для GET: повтор POST может продублировать ордер.
+        # После исчерпания повторов возвращается последний ответ OKX (например, JSON 429),
+        # а не RetryError; Retry-After игнорируется, чтобы не держать поток пула надолго
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.1,
+                status_forcelist=[429, 502, 503, 504],
+                allowed_methods=['GET'],
+                raise_on_status=False,
+                respect_retry_after_header=False
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
     
     def get_server_timestamp(self) -> str:
         """
@@ -37,14 +253,64 @@ class OKXService:
         Returns:
             str: Временная метка в формате ISO 8601 (например: 2025-07-25T12:30:45.123Z)
         """
-        from datetime import datetime, timezone
-        # Получаем UTC время без микросекунд
-        timestamp = datetime.now(timezone.utc).replace(microsecond=0).isoformat()
-        # Заменяем +00:00 на Z для соответствия требованиям OKX
-        timestamp = timestamp.replace('+00:00', 'Z')
-        logger.info(f"Сгенерирована временная метка ISO 8601 для OKX: {timestamp}")
+        # Форматируем напрямую из epoch, без создания datetime/timezone объектов
+        t = time.time()
+        secs = int(t)
+        ms = int((t - secs) * 1000)
+        
+        # Часть с точностью до секунды пересчитываем только при смене секунды
+        cached_secs, prefix = self._ts_cache
+        if secs != cached_secs:
+            prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(secs))
+            self._ts_cache = (secs, prefix)
+        
+        timestamp = f"{prefix}.{ms:03d}Z"
+        logger.debug("Сгенерирована временная метка ISO 8601 для OKX: {}", timestamp)
         return timestamp
     
+    def warm_up_connection(self) -> None:
+        """
+        Предварительное установление TLS-соединения с OKX
+        
+        Легкий запрос к публичному API наполняет пул живым соединением,
+        поэтому первый торговый запрос не тратит время на рукопожатие.
+        Вызывается при запуске приложения, а не при импорте модуля.
+        """
+        try:
+            self.session.get(f"{self.base_url}/api/v5/public/time", timeout=3)
+            logger.debug("Соединение с OKX API прогрето")
+        except requests.exceptions.RequestException as e:
+            logger.warning("Не удалось прогреть соединение с OKX API: {}", e)
+    
+    @staticmethod
+    def _parse(response: requests.Response) -> Dict:
+        """
+        Разбор JSON ответа OKX через orjson
+        
+        Args:
+            response: HTTP ответ
+            
+        Returns:
+            Dict: Разобранный JSON
+        """
+        return orjson.loads(response.content)
+    
+    def _get_json(self, path: str, params: Optional[Dict] = None, timeout: int = 30) -> Dict:
+        """
+        Публичный GET запрос к OKX API с разбором JSON ответа
+        
+        Args:
+            path: Путь запроса
+            params: Параметры query string
+            timeout: Таймаут запроса в секундах
+            
+        Returns:
+            Dict: Разобранный JSON ответ
+        """
+        url = _build_url(self.base_url, path, tuple(params.items()) if params else ())
+        response = self.session.get(url, timeout=timeout)
+        return self._parse(response)
+    
     def test_connection(self) -> Dict:
         """
         Тестирование соединения с OKX API
@@ -61,32 +327,31 @@ class OKXService:
             try:
                 response = self.session.get(
                     test_url,
-                    timeout=10,
-                    verify=True
+                    timeout=10
                 )
                 if response.status_code == 200:
                     logger.info("✅ Соединение с OKX API успешно")
                     return {
                         "status": "success",
                         "message": "Соединение с OKX API работает",
-                        "response": response.json()
+                        "response": self._parse(response)
                     }
                 else:
-                    logger.error(f"❌ Ошибка HTTP: {response.status_code}")
+                    logger.error("❌ Ошибка HTTP: {}", response.status_code)
                     return {
                         "status": "error",
                         "message": f"HTTP ошибка: {response.status_code}",
                         "response": response.text
                     }
             except requests.exceptions.SSLError as e:
-                logger.error(f"❌ SSL ошибка: {e}")
+                logger.error("❌ SSL ошибка: {}", e)
                 return {
                     "status": "ssl_error",
                     "message": f"SSL ошибка: {e}",
                     "suggestion": "Проверьте настройки SSL сертификатов на сервере"
                 }
             except requests.exceptions.RequestException as e:
-                logger.error(f"❌ Ошибка сети: {e}")
+                logger.error("❌ Ошибка сети: {}", e)
                 return {
                     "status": "network_error",
                     "message": f"Ошибка сети: {e}",
@@ -94,7 +359,7 @@ class OKXService:
                 }
                 
         except Exception as e:
-            logger.error(f"❌ Неожиданная ошибка: {e}")
+            logger.error("❌ Неожиданная ошибка: {}", e)
             return {
                 "status": "unknown_error",
                 "message": f"Неожиданная ошибка: {e}"
@@ -105,7 +370,7 @@ class OKXService:
         timestamp: str, 
         method: str, 
         request_path: str, 
-        body: str = ""
+        body: Union[str, bytes] = ""
     ) -> str:
         """
         Генерация подписи для OKX API
@@ -114,41 +379,102 @@ class OKXService:
             timestamp: Временная метка
             method: HTTP метод (GET, POST, etc.)
             request_path: Путь запроса
-            body: Тело запроса (для POST запросов)
+            body: Тело запроса (для POST запросов), строка или уже закодированные байты
             
         Returns:
             str: Base64-кодированная подпись
         """
         try:
-            message = f'{timestamp}{method.upper()}{request_path}{body}'
-            
             if not self.api_secret:
                 raise ValueError("API_SECRET не настроен")
             
             # Отладочная информация
-            logger.info(f"Сообщение для подписи: '{message}'")
-            logger.info(f"Длина сообщения: {len(message)}")
-            logger.info(f"Body: '{body}' (длина: {len(body)})")
-            
-            mac = hmac.new(
-                self.api_secret.encode('utf-8'), 
-                message.encode('utf-8'), 
-                sha256
-            )
-            signature = base64.b64encode(mac.digest()).decode()
+            logger.debug("Сообщение для подписи: '{}{}{}{}'", timestamp, method.upper(), request_path, body)
+            logger.debug("Body: '{}' (длина: {})", body, len(body))
+            
+            signer = self._get_signer(method, request_path)
+            body_bytes = body if isinstance(body, bytes) else body.encode('utf-8')
+            signature = signer(timestamp.encode('ascii'), body_bytes).decode('ascii')
             
-            logger.info(f"Сгенерирована подпись: {signature}")
+            logger.debug("Сгенерирована подпись: {}", signature)
             return signature
             
         except Exception as e:
-            logger.error(f"Ошибка генерации подписи: {e}")
+            logger.error("Ошибка генерации подписи: {}", e)
             raise
     
+    def _make_signer(self, method: str, request_path: str) -> Callable[[bytes, bytes], bytes]:
+        """
+        Создание подписанта, специализированного под фиксированные метод и путь
+        
+        Args:
+            method: HTTP метод
+            request_path: Путь запроса
+            
+        Returns:
+            Callable[[bytes, bytes], bytes]: Функция (timestamp, body) -> Base64-подпись
+        """
+        method_path = f"{method.upper()}{request_path}".encode('utf-8')
+        template = self._hmac_template
+        
+        def sign(timestamp_bytes: bytes, body_bytes: bytes) -> bytes:
+            # Копия шаблона уже содержит обработанный ключ (ipad/opad)
+            mac = template.copy()
+            mac.update(timestamp_bytes + method_path + body_bytes)
+            return base64.b64encode(mac.digest())
+        
+        return sign
+    
+    def _get_signer(self, method: str, request_path: str) -> Callable[[bytes, bytes], bytes]:
+        """
+        Получение подписанта из кэша или создание нового
+        
+        Args:
+            method: HTTP метод
+            request_path: Путь запроса
+            
+        Returns:
+            Callable[[bytes, bytes], bytes]: Подписант для (method, request_path)
+        """
+        key = (method, request_path)
+        signer = self._signers.get(key)
+        if signer is None:
+            if len(self._signers) >= _SIGNERS_CACHE_SIZE:
+                self._signers.clear()
+            signer = self._make_signer(method, request_path)
+            self._signers[key] = signer
+        return signer
+    
+    def sign_many(self, requests_list: List[Tuple[str, str, Union[str, bytes]]]) -> List[Tuple[str, str]]:
+        """
+        Подпись одного или нескольких запросов одной временной меткой
+        
+        Используется get_auth_headers; подписанты берутся из кэша по (method, path).
+        
+        Args:
+            requests_list: Список кортежей (method, request_path, body)
+            
+        Returns:
+            List[Tuple[str, str]]: Список пар (timestamp, signature) в порядке запросов
+        """
+        if not self.api_secret:
+            raise ValueError("API_SECRET не настроен")
+        
+        timestamp = self.get_server_timestamp()
+        timestamp_bytes = timestamp.encode('ascii')
+        result = []
+        for method, request_path, body in requests_list:
+            body_bytes = body if isinstance(body, bytes) else body.encode('utf-8')
+            signature = self._get_signer(method, request_path)(timestamp_bytes, body_bytes).decode('ascii')
+            result.append((timestamp, signature))
+        
+        return result
+    
     def get_auth_headers(
         self, 
         method: str, 
         request_path: str, 
-        body: str = "",
+        body: Union[str, bytes] = "",
         demo: bool = False
     ) -> Dict[str, str]:
         """
@@ -157,31 +483,38 @@ class OKXService:
         Args:
             method: HTTP метод
             request_path: Путь запроса
-            body: Тело запроса
+            body: Тело запроса (строка или байты)
             demo: Режим демо-трейдинга (True для симуляции)
             
         Returns:
             Dict[str, str]: Заголовки авторизации
         """
         try:
-            timestamp = self.get_server_timestamp()
-            signature = self.generate_signature(timestamp, method, request_path, body)
-            mode = "1" if demo else "0"  # '1' для демо (симуляция), '0' для реального
-            
-            headers = {
-                'OK-ACCESS-KEY': self.api_key.strip(),
-                'OK-ACCESS-SIGN': signature.strip(),
-                'OK-ACCESS-TIMESTAMP': timestamp.strip(),
-                'OK-ACCESS-PASSPHRASE': self.passphrase.strip(),
-                'Content-Type': 'application/json',
-                'x-simulated-trading': mode  # Демо режим
-            }
-            
-            logger.info(f"Сгенерированы заголовки авторизации для {method} {request_path} (demo: {demo})")
+            cacheable = not body and method.upper() == "GET"
+            if cacheable:
+                secs = int(time.time())
+                key = (request_path, demo)
+                cached = self._get_headers_cache.get(key)
+                if cached is not None and cached[0] == secs:
+                    return cached[1].copy()
+            
+            timestamp, signature = self.sign_many([(method, request_path, body)])[0]
+            
+            headers = self._base_headers.copy()
+            headers['OK-ACCESS-SIGN'] = signature
+            headers['OK-ACCESS-TIMESTAMP'] = timestamp
+            headers['x-simulated-trading'] = "1" if demo else "0"  # '1' для демо (симуляция), '0' для реального
+            
+            if cacheable:
+                if len(self._get_headers_cache) >= _SIGNERS_CACHE_SIZE:
+                    self._get_headers_cache.clear()
+                self._get_headers_cache[key] = (secs, headers.copy())
+            
+            logger.debug("Сгенерированы заголовки авторизации для {} {} (demo: {})", method, request_path, demo)
             return headers
             
         except Exception as e:
-            logger.error(f"Ошибка получения заголовков авторизации: {e}")
+            logger.error("Ошибка получения заголовков авторизации: {}", e)
             raise
     
     def get_sign_and_timestamp(
@@ -210,11 +543,11 @@ class OKXService:
                 'OK-ACCESS-TIMESTAMP': timestamp.strip()  # Убираем лишние пробелы
             }
             
-            logger.info(f"Получены подпись и временная метка для {method} {request_path}")
+            logger.debug("Получены подпись и временная метка для {} {}", method, request_path)
             return result
             
         except Exception as e:
-            logger.error(f"Ошибка получения подписи и временной метки: {e}")
+            logger.error("Ошибка получения подписи и временной метки: {}", e)
             raise
 
 
@@ -231,8 +564,6 @@ class OKXService:
         Returns:
             Dict: Результат размещения ордера
         """
-        import json
-        
         path = '/api/v5/trade/order'
         url = self.base_url + path
         
@@ -245,26 +576,26 @@ class OKXService:
             "sz": str(notional)
         }
         
-        body_str = json.dumps(body, separators=(",", ":"))
-        logger.info(f"{side.upper()} BODY: {body_str}")
+        body_bytes = orjson.dumps(body)
+        logger.info("{} BODY: {}", side.upper(), body_bytes.decode('utf-8'))
         
-        headers = self.get_auth_headers("POST", path, body_str, demo=demo)
+        headers = self.get_auth_headers("POST", path, body_bytes, demo=demo)
         
         try:
             response = self.session.post(
                 url, 
                 headers=headers, 
-                data=body_str,
-                timeout=30,
-                verify=True
+                data=body_bytes,
+                timeout=30
             )
-            logger.info(f"{side.upper()} ORDER RESULT: {response.text}")
-            return response.json()
+            data = self._parse(response)
+            logger.info("{} ORDER RESULT: {}", side.upper(), data)
+            return data
         except requests.exceptions.SSLError as e:
-            logger.error(f"SSL ошибка при размещении ордера: {e}")
+            logger.error("SSL ошибка при размещении ордера: {}", e)
             raise
         except requests.exceptions.RequestException as e:
-            logger.error(f"Ошибка сети при размещении ордера: {e}")
+            logger.error("Ошибка сети при размещении ордера: {}", e)
             raise
 
 
@@ -280,7 +611,6 @@ class OKXService:
         Returns:
             Dict: Результат размещения ордера
         """
-        import json
         path = '/api/v5/trade/order'
         url = self.base_url + path
 
@@ -292,26 +622,26 @@ class OKXService:
             "sz": str(amount_btc)  # всегда в BTC
         }
 
-        body_str = json.dumps(body, separators=(",", ":"))
-        logger.info(f"SELL MARKET BODY: {body_str}")
+        body_bytes = orjson.dumps(body)
+        logger.info("SELL MARKET BODY: {}", body_bytes.decode('utf-8'))
 
-        headers = self.get_auth_headers("POST", path, body_str, demo=demo)
+        headers = self.get_auth_headers("POST", path, body_bytes, demo=demo)
 
         try:
             response = self.session.post(
                 url,
                 headers=headers,
-                data=body_str,
-                timeout=30,
-                verify=True
+                data=body_bytes,
+                timeout=30
             )
-            logger.info(f"SELL MARKET ORDER RESULT: {response.text}")
-            return response.json()
+            data = self._parse(response)
+            logger.info("SELL MARKET ORDER RESULT: {}", data)
+            return data
         except requests.exceptions.SSLError as e:
-            logger.error(f"SSL ошибка при размещении ордера: {e}")
+            logger.error("SSL ошибка при размещении ордера: {}", e)
             raise
         except requests.exceptions.RequestException as e:
-            logger.error(f"Ошибка сети при размещении ордера: {e}")
+            logger.error("Ошибка сети при размещении ордера: {}", e)
             raise
     
     def get_balance(self, ccy: str, demo: bool = False) -> float:
@@ -325,49 +655,53 @@ class OKXService:
         Returns:
             float: Доступный баланс
         """
-        path = f'/api/v5/account/balance?ccy={ccy}'
-        url = self.base_url + path
+        path = '/api/v5/account/balance'
+        params = {'ccy': ccy}
         
-        headers = self.get_auth_headers("GET", path, demo=demo)
+        # Для подписи нужен путь с query string; urlencode дает ту же строку, что и requests
+        headers = self.get_auth_headers("GET", f"{path}?{urlencode(params)}", demo=demo)
         
         try:
             response = self.session.get(
-                url, 
+                self.base_url + path,
+                params=params,
                 headers=headers,
-                timeout=30,
-                verify=True
+                timeout=30
             )
-            data = response.json()
+            data = self._parse(response)
             
             # Проверяем наличие ошибки в ответе
             if 'code' in data and data['code'] != '0':
-                logger.error(f"Ошибка API при получении баланса {ccy}: {data}")
+                logger.error("Ошибка API при получении баланса {}: {}", ccy, data)
                 return 0.0
             
             # Проверяем структуру данных
             if 'data' not in data or not data['data']:
-                logger.warning(f"Нет данных баланса для {ccy}")
+                logger.warning("Нет данных баланса для {}", ccy)
                 return 0.0
             
-            # Извлекаем баланс
-            for account in data['data']:
-                if 'details' in account and account['details']:
-                    for detail in account['details']:
-                        if detail.get('ccy') == ccy:
-                            avail_bal = detail.get('availBal', '0')
-                            return float(avail_bal)
+            # Извлекаем баланс: первая запись нужной валюты
+            details = (
+                detail
+                for account in data['data']
+                for detail in account.get('details') or []
+                if detail.get('ccy') == ccy
+            )
+            found = next(details, None)
+            if found is not None:
+                return float(found.get('availBal', '0'))
             
-            logger.warning(f"Баланс {ccy} не найден")
+            logger.warning("Баланс {} не найден", ccy)
             return 0.0
             
         except requests.exceptions.SSLError as e:
-            logger.error(f"SSL ошибка при получении баланса: {e}")
+            logger.error("SSL ошибка при получении баланса: {}", e)
             return 0.0
         except requests.exceptions.RequestException as e:
-            logger.error(f"Ошибка сети при получении баланса: {e}")
+            logger.error("Ошибка сети при получении баланса: {}", e)
             return 0.0
         except (KeyError, ValueError, TypeError) as e:
-            logger.error(f"Ошибка парсинга баланса {ccy}: {e}")
+            logger.error("Ошибка парсинга баланса {}: {}", ccy, e)
             return 0.0
 
 
@@ -375,7 +709,7 @@ class OKXService:
         """
         Обёртка для продажи BTC в маркет
         """
-        logger.info(f"Продажа BTC в маркет: {sell_amount} BTC (demo: {demo})")
+        logger.info("Продажа BTC в маркет: {} BTC (demo: {})", sell_amount, demo)
 
         result = self.place_market_sell_order(
             amount_btc=sell_amount,
@@ -403,24 +737,30 @@ class OKXService:
             Dict: Упрощенная рыночная информация
         """
         try:
-            logger.info(f"Получение рыночных данных для {inst_id}")
+            logger.info("Получение рыночных данных для {}", inst_id)
             
             result = {}
             
+            # Три независимых запроса выполняются параллельно: ~1 RTT вместо 3
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                ticker_future = executor.submit(
+                    self._get_json, '/api/v5/market/ticker', {'instId': inst_id}
+                )
+                books_future = executor.submit(
+                    self._get_json, '/api/v5/market/books', {'instId': inst_id, 'sz': 3}
+                )
+                candles_future = executor.submit(
+                    self._get_json, '/api/v5/market/candles', {'instId': inst_id, 'bar': '5m', 'limit': 10}
+                )
+            
             # 1. Только основные данные тикера
-            ticker_path = f'/api/v5/market/ticker?instId={inst_id}'
             try:
-                ticker_response = self.session.get(
-                    self.base_url + ticker_path,
-                    timeout=30,
-                    verify=True
-                )
-                ticker_data = ticker_response.json()
+                ticker_data = ticker_future.result()
             except requests.exceptions.SSLError as e:
-                logger.error(f"SSL ошибка при получении тикера: {e}")
+                logger.error("SSL ошибка при получении тикера: {}", e)
                 raise
             except requests.exceptions.RequestException as e:
-                logger.error(f"Ошибка сети при получении тикера: {e}")
+                logger.error("Ошибка сети при получении тикера: {}", e)
                 raise
             
             # Извлекаем только нужные поля
@@ -445,19 +785,13 @@ class OKXService:
                 }
             
             # 2. Упрощенный стакан ордеров (только первые 3 уровня)
-            books_path = f'/api/v5/market/books?instId={inst_id}&sz=3'
             try:
-                books_response = self.session.get(
-                    self.base_url + books_path,
-                    timeout=30,
-                    verify=True
-                )
-                books_data = books_response.json()
+                books_data = books_future.result()
             except requests.exceptions.SSLError as e:
-                logger.error(f"SSL ошибка при получении стакана: {e}")
+                logger.error("SSL ошибка при получении стакана: {}", e)
                 raise
             except requests.exceptions.RequestException as e:
-                logger.error(f"Ошибка сети при получении стакана: {e}")
+                logger.error("Ошибка сети при получении стакана: {}", e)
                 raise
             
             if 'data' in books_data and books_data['data']:
@@ -469,31 +803,26 @@ class OKXService:
                 }
             
             # 3. Только последние 10 свечей (вместо 288)
-            candles_path = f'/api/v5/market/candles?instId={inst_id}&bar=5m&limit=10'
             try:
-                candles_response = self.session.get(
-                    self.base_url + candles_path,
-                    timeout=30,
-                    verify=True
-                )
-                candles_data = candles_response.json()
+                candles_data = candles_future.result()
             except requests.exceptions.SSLError as e:
-                logger.error(f"SSL ошибка при получении свечей: {e}")
+                logger.error("SSL ошибка при получении свечей: {}", e)
                 raise
             except requests.exceptions.RequestException as e:
-                logger.error(f"Ошибка сети при получении свечей: {e}")
+                logger.error("Ошибка сети при получении свечей: {}", e)
                 raise
             
             if 'data' in candles_data:
                 result['candles'] = candles_data['data'][:10]  # Только последние 10
             
-            logger.info(f"Упрощенные рыночные данные для {inst_id} успешно получены")
+            logger.info("Упрощенные рыночные данные для {} успешно получены", inst_id)
             return result
             
         except Exception as e:
-            logger.error(f"Ошибка получения рыночных данных: {e}")
+            logger.error("Ошибка получения рыночных данных: {}", e)
             raise
     
+    @_ttl_cache(2)
     def get_tickers_data(self, inst_type: str = "SPOT") -> Dict:
         """
         Получение данных по всем тикерам
@@ -505,30 +834,25 @@ class OKXService:
             Dict: Данные всех тикеров
         """
         try:
-            logger.info(f"Получение данных тикеров для {inst_type}")
+            logger.info("Получение данных тикеров для {}", inst_type)
             
-            path = f'/api/v5/market/tickers?instType={inst_type}'
             try:
-                response = self.session.get(
-                    self.base_url + path,
-                    timeout=30,
-                    verify=True
-                )
-                result = response.json()
+                result = self._get_json('/api/v5/market/tickers', {'instType': inst_type})
             except requests.exceptions.SSLError as e:
-                logger.error(f"SSL ошибка при получении тикеров: {e}")
+                logger.error("SSL ошибка при получении тикеров: {}", e)
                 raise
             except requests.exceptions.RequestException as e:
-                logger.error(f"Ошибка сети при получении тикеров: {e}")
+                logger.error("Ошибка сети при получении тикеров: {}", e)
                 raise
             
-            logger.info(f"Данные тикеров для {inst_type} успешно получены")
+            logger.info("Данные тикеров для {} успешно получены", inst_type)
             return result
             
         except Exception as e:
-            logger.error(f"Ошибка получения данных тикеров: {e}")
+            logger.error("Ошибка получения данных тикеров: {}", e)
             raise
     
+    @_ttl_cache(3600)
     def get_currencies_data(self) -> Dict:
         """
         Получение информации о валютах
@@ -544,22 +868,21 @@ class OKXService:
             try:
                 response = self.session.get(
                     self.base_url + currencies_path,
-                    timeout=30,
-                    verify=True
+                    timeout=30
                 )
-                data = response.json()
+                data = self._parse(response)
             except requests.exceptions.SSLError as e:
-                logger.error(f"SSL ошибка при получении информации о валютах: {e}")
+                logger.error("SSL ошибка при получении информации о валютах: {}", e)
                 raise
             except requests.exceptions.RequestException as e:
-                logger.error(f"Ошибка сети при получении информации о валютах: {e}")
+                logger.error("Ошибка сети при получении информации о валютах: {}", e)
                 raise
             
             logger.info("Информация о валютах успешно получена")
             return data
             
         except Exception as e:
-            logger.error(f"Ошибка получения информации о валютах: {e}")
+            logger.error("Ошибка получения информации о валютах: {}", e)
             raise
 
 
@@ -571,7 +894,7 @@ class OKXService:
             Dict: Результат отмены
         """
         try:
-            logger.info(f"Попытка отменить ордер {ord_id} на инструменте {inst_id}")
+            logger.info("Попытка отменить ордер {} на инструменте {}", ord_id, inst_id)
 
             path = "/api/v5/trade/cancel-order"
             payload = {
@@ -579,17 +902,16 @@ class OKXService:
                 "ordId": ord_id
             }
 
-            body_str = json.dumps(payload)
+            body_bytes = orjson.dumps(payload)
             response = self.session.post(
                 self.base_url + path,
-                headers=self.get_auth_headers("POST", path, body=body_str, demo=demo),
-                json=payload,
-                timeout=30,
-                verify=True
+                headers=self.get_auth_headers("POST", path, body=body_bytes, demo=demo),
+                data=body_bytes,
+                timeout=30
             )
 
-            data = response.json()
-            logger.debug(f"Ответ от OKX при отмене ордера: {json.dumps(data, indent=2, ensure_ascii=False)}")
+            data = self._parse(response)
+            logger.opt(lazy=True).debug("Ответ от OKX при отмене ордера: {}", lambda: json.dumps(data, indent=2, ensure_ascii=False))
 
             cancelled = data.get("data", [{}])[0]
 
@@ -600,7 +922,7 @@ class OKXService:
             }
 
         except Exception as e:
-            logger.error(f"Ошибка отмены ордера: {e}")
+            logger.error("Ошибка отмены ордера: {}", e)
             return {
                 "success": False,
                 "cancelled_order": {},
@@ -624,18 +946,17 @@ class OKXService:
                 response = self.session.get(
                     self.base_url + orders_path,
                     headers=self.get_auth_headers("GET", orders_path, demo=demo),
-                    timeout=30,
-                    verify=True
+                    timeout=30
                 )
-                data = response.json()
+                data = self._parse(response)
             except requests.exceptions.SSLError as e:
-                logger.error(f"SSL ошибка при получении ордеров: {e}")
+                logger.error("SSL ошибка при получении ордеров: {}", e)
                 raise
             except requests.exceptions.RequestException as e:
-                logger.error(f"Ошибка сети при получении ордеров: {e}")
+                logger.error("Ошибка сети при получении ордеров: {}", e)
                 raise
 
-            logger.debug(f"Сырой JSON ордеров от OKX: {json.dumps(data, indent=2, ensure_ascii=False)}")
+            logger.opt(lazy=True).debug("Сырой JSON ордеров от OKX: {}", lambda: json.dumps(data, indent=2, ensure_ascii=False))
 
             orders = data.get("data", [])
 
@@ -645,11 +966,11 @@ class OKXService:
                 "message": "Ордера успешно получены"
             }
 
-            logger.info(f"Открытых ордеров: {len(orders)}")
+            logger.info("Открытых ордеров: {}", len(orders))
             return result
 
         except Exception as e:
-            logger.error(f"Ошибка получения ордеров: {e}")
+            logger.error("Ошибка получения ордеров: {}", e)
             return {
                 "success": False,
                 "orders": [],
@@ -683,7 +1004,7 @@ class OKXService:
             Dict: Список последних сделок и статус выполнения
         """
         try:
-            logger.info(f"Получение последних сделок с параметрами: inst_type={inst_type}, inst_id={inst_id}, ord_id={ord_id}, after={after}, before={before}, limit={limit}")
+            logger.info("Получение последних сделок с параметрами: inst_type={}, inst_id={}, ord_id={}, after={}, before={}, limit={}", inst_type, inst_id, ord_id, after, before, limit)
             
             path = '/api/v5/trade/fills'
             params = {}
@@ -702,27 +1023,26 @@ class OKXService:
             if limit:
                 params['limit'] = str(limit)
             
-            # Формируем query string для подписи
-            query_string = '&'.join([f"{k}={v}" for k, v in params.items()]) if params else ''
+            # Формируем query string для подписи (с URL-кодированием значений)
+            query_string = urlencode(params) if params else ''
             request_path = f"{path}?{query_string}" if query_string else path
             
             try:
+                # Отправляем ровно ту строку запроса, которая была подписана
                 response = self.session.get(
-                    self.base_url + path,
+                    self.base_url + request_path,
                     headers=self.get_auth_headers("GET", request_path, demo=demo),
-                    params=params,
-                    timeout=30,
-                    verify=True
+                    timeout=30
                 )
-                data = response.json()
+                data = self._parse(response)
             except requests.exceptions.SSLError as e:
-                logger.error(f"SSL ошибка при получении сделок: {e}")
+                logger.error("SSL ошибка при получении сделок: {}", e)
                 raise
             except requests.exceptions.RequestException as e:
-                logger.error(f"Ошибка сети при получении сделок: {e}")
+                logger.error("Ошибка сети при получении сделок: {}", e)
                 raise
             
-            logger.debug(f"Сырой JSON сделок от OKX: {json.dumps(data, indent=2, ensure_ascii=False)}")
+            logger.opt(lazy=True).debug("Сырой JSON сделок от OKX: {}", lambda: json.dumps(data, indent=2, ensure_ascii=False))
             
             fills = data.get("data", [])
             
@@ -732,11 +1052,11 @@ class OKXService:
                 "message": f"Получено {len(fills)} сделок"
             }
             
-            logger.info(f"Последние сделки успешно получены: {len(fills)} записей")
+            logger.info("Последние сделки успешно получены: {} записей", len(fills))
             return result
             
         except Exception as e:
-            logger.error(f"Ошибка получения последних сделок: {e}")
+            logger.error("Ошибка получения последних сделок: {}", e)
             return {
                 "success": False,
                 "fills": [],
@@ -760,33 +1080,32 @@ class OKXService:
                 response = self.session.get(
                     self.base_url + balances_path,
                     headers=self.get_auth_headers("GET", balances_path, demo=demo),
-                    timeout=30,
-                    verify=True
+                    timeout=30
                 )
-                data = response.json()
+                data = self._parse(response)
             except requests.exceptions.SSLError as e:
-                logger.error(f"SSL ошибка при получении балансов: {e}")
+                logger.error("SSL ошибка при получении балансов: {}", e)
                 raise
             except requests.exceptions.RequestException as e:
-                logger.error(f"Ошибка сети при получении балансов: {e}")
+                logger.error("Ошибка сети при получении балансов: {}", e)
                 raise
 
             # Лог сырого ответа
-            logger.debug(f"Сырой JSON от OKX: {json.dumps(data, indent=2, ensure_ascii=False)}")
+            logger.opt(lazy=True).debug("Сырой JSON от OKX: {}", lambda: json.dumps(data, indent=2, ensure_ascii=False))
 
-            # Извлекаем балансы
+            # Извлекаем балансы: некорректная запись пропускается
             balances = {}
-            if 'data' in data and data['data']:
-                for account in data['data']:
-                    if 'details' in account:
-                        for detail in account['details']:
-                            ccy = detail.get('ccy', '')
-                            bal = detail.get('cashBal') or detail.get('availBal') or detail.get('eq') or '0'
-                            try:
-                                if ccy and float(bal) > 0:
-                                    balances[ccy] = float(bal)
-                            except ValueError:
-                                logger.warning(f"Невозможно преобразовать баланс {bal} для валюты {ccy}")
+            for account in data.get('data') or []:
+                for detail in account.get('details') or []:
+                    ccy = detail.get('ccy', '')
+                    bal = detail.get('cashBal') or detail.get('availBal') or detail.get('eq') or '0'
+                    try:
+                        value = float(bal)
+                    except (TypeError, ValueError):
+                        logger.warning("Невозможно преобразовать баланс {} для валюты {}", bal, ccy)
+                        continue
+                    if ccy and value > 0:
+                        balances[ccy] = value
 
             result = {
                 "success": True,
@@ -794,17 +1113,18 @@ class OKXService:
                 "message": "Баланс успешно получен"
             }
 
-            logger.info(f"Балансы успешно получены: {balances}")
+            logger.info("Балансы успешно получены: {}", balances)
             return result
 
         except Exception as e:
-            logger.error(f"Ошибка получения балансов: {e}")
+            logger.error("Ошибка получения балансов: {}", e)
             return {
                 "success": False,
                 "balances": {},
                 "message": f"Ошибка получения балансов: {e}"
             }
 
+    @_ttl_cache(0.2)
     def get_orderbook(self, inst_id: str = "BTC-USDT", depth: int = 20) -> Dict:
         """
         Получение стакана ордеров
@@ -817,40 +1137,33 @@ class OKXService:
             Dict: Стакан ордеров
         """
         try:
-            logger.info(f"Получение стакана ордеров для {inst_id} с глубиной {depth}")
-            
-            path = f'/api/v5/market/books?instId={inst_id}&sz={depth}'
+            logger.info("Получение стакана ордеров для {} с глубиной {}", inst_id, depth)
             
             try:
-                response = self.session.get(
-                    self.base_url + path,
-                    timeout=30,
-                    verify=True
-                )
-                data = response.json()
+                data = self._get_json('/api/v5/market/books', {'instId': inst_id, 'sz': depth})
                 
                 # Детальное логирование ответа
-                logger.info(f"ORDERBOOK RAW RESPONSE: {data}")
-                logger.info(f"Response code: {data.get('code', 'Нет кода')}")
-                logger.info(f"Response msg: {data.get('msg', 'Нет сообщения')}")
-                logger.info(f"Data length: {len(data.get('data', []))}")
+                logger.debug("ORDERBOOK RAW RESPONSE: {}", data)
+                logger.debug("Response code: {}", data.get('code', 'Нет кода'))
+                logger.debug("Response msg: {}", data.get('msg', 'Нет сообщения'))
+                logger.debug("Data length: {}", len(data.get('data', [])))
                 
                 if data.get('code') == '0' and data.get('data'):
-                    logger.info(f"Стакан ордеров успешно получен: {len(data['data'])} записей")
+                    logger.info("Стакан ордеров успешно получен: {} записей", len(data['data']))
                     return {"success": True, "data": data['data']}
                 else:
-                    logger.warning(f"Проблема с получением стакана: {data}")
+                    logger.warning("Проблема с получением стакана: {}", data)
                     return {"success": False, "data": [], "error": data.get('msg', 'Неизвестная ошибка')}
                 
             except requests.exceptions.SSLError as e:
-                logger.error(f"SSL ошибка при получении стакана: {e}")
+                logger.error("SSL ошибка при получении стакана: {}", e)
                 raise
             except requests.exceptions.RequestException as e:
-                logger.error(f"Ошибка сети при получении стакана: {e}")
+                logger.error("Ошибка сети при получении стакана: {}", e)
                 raise
             
         except Exception as e:
-            logger.error(f"Ошибка получения стакана ордеров: {e}")
+            logger.error("Ошибка получения стакана ордеров: {}", e)
             return {
                 "code": "1",
                 "msg": f"Ошибка получения стакана: {e}",
@@ -858,6 +1171,7 @@ class OKXService:
             }
 
 
+    @_ttl_cache(1)
     def get_current_candles(self, inst_id: str = "BTC-USDT", bar: str = "1m", limit: int = 100) -> Dict:
         """
         Получение текущих свечей
@@ -871,41 +1185,37 @@ class OKXService:
             Dict: Текущие свечи
         """
         try:
-            logger.info(f"Получение текущих свечей для {inst_id}, интервал {bar}, количество {limit}")
+            logger.info("Получение текущих свечей для {}, интервал {}, количество {}", inst_id, bar, limit)
             
-            path = f'/api/v5/market/candles?instId={inst_id}&bar={bar}&limit={limit}'
-            logger.info(f"REQUEST URL: {self.base_url + path}")
+            path = '/api/v5/market/candles'
+            params = {'instId': inst_id, 'bar': bar, 'limit': limit}
+            logger.debug("REQUEST URL: {} {}", self.base_url + path, params)
             
             try:
-                response = self.session.get(
-                    self.base_url + path,
-                    timeout=30,
-                    verify=True
-                )
-                data = response.json()
+                data = self._get_json(path, params)
                 
                 # Детальное логирование ответа
-                logger.info(f"CANDLES RAW RESPONSE: {data}")
-                logger.info(f"Response code: {data.get('code', 'Нет кода')}")
-                logger.info(f"Response msg: {data.get('msg', 'Нет сообщения')}")
-                logger.info(f"Data length: {len(data.get('data', []))}")
+                logger.debug("CANDLES RAW RESPONSE: {}", data)
+                logger.debug("Response code: {}", data.get('code', 'Нет кода'))
+                logger.debug("Response msg: {}", data.get('msg', 'Нет сообщения'))
+                logger.debug("Data length: {}", len(data.get('data', [])))
                 
                 if data.get('code') == '0' and data.get('data'):
-                    logger.info(f"Свечи успешно получены: {len(data['data'])} записей")
+                    logger.info("Свечи успешно получены: {} записей", len(data['data']))
                     return {"success": True, "data": data['data']}
                 else:
-                    logger.warning(f"Проблема с получением свечей: {data}")
+                    logger.warning("Проблема с получением свечей: {}", data)
                     return {"success": False, "data": [], "error": data.get('msg', 'Неизвестная ошибка')}
                 
             except requests.exceptions.SSLError as e:
-                logger.error(f"SSL ошибка при получении свечей: {e}")
+                logger.error("SSL ошибка при получении свечей: {}", e)
                 raise
             except requests.exceptions.RequestException as e:
-                logger.error(f"Ошибка сети при получении свечей: {e}")
+                logger.error("Ошибка сети при получении свечей: {}", e)
                 raise
             
         except Exception as e:
-            logger.error(f"Ошибка получения текущих свечей: {e}")
+            logger.error("Ошибка получения текущих свечей: {}", e)
             return {
                 "code": "1",
                 "msg": f"Ошибка получения свечей: {e}",
@@ -926,29 +1236,25 @@ class OKXService:
             Dict: Исторические свечи
         """
         try:
-            logger.info(f"Получение исторических свечей для {inst_id}, интервал {bar}, количество {limit}")
-            
-            path = f'/api/v5/market/history-candles?instId={inst_id}&bar={bar}&limit={limit}'
+            logger.info("Получение исторических свечей для {}, интервал {}, количество {}", inst_id, bar, limit)
             
             try:
-                response = self.session.get(
-                    self.base_url + path,
-                    timeout=30,
-                    verify=True
+                data = self._get_json(
+                    '/api/v5/market/history-candles',
+                    {'instId': inst_id, 'bar': bar, 'limit': limit}
                 )
-                data = response.json()
             except requests.exceptions.SSLError as e:
-                logger.error(f"SSL ошибка при получении исторических свечей: {e}")
+                logger.error("SSL ошибка при получении исторических свечей: {}", e)
                 raise
             except requests.exceptions.RequestException as e:
-                logger.error(f"Ошибка сети при получении исторических свечей: {e}")
+                logger.error("Ошибка сети при получении исторических свечей: {}", e)
                 raise
             
-            logger.info(f"Исторические свечи для {inst_id} успешно получены")
+            logger.info("Исторические свечи для {} успешно получены", inst_id)
             return data
             
         except Exception as e:
-            logger.error(f"Ошибка получения исторических свечей: {e}")
+            logger.error("Ошибка получения исторических свечей: {}", e)
             return {
                 "code": "1",
                 "msg": f"Ошибка получения исторических свечей: {e}",
@@ -968,30 +1274,31 @@ class OKXService:
             Dict: Активные ордера
         """
         try:
-            logger.info(f"Получение активных ордеров для {inst_id}")
+            logger.info("Получение активных ордеров для {}", inst_id)
             
-            path = f'/api/v5/trade/orders-pending?instId={inst_id}'
+            path = '/api/v5/trade/orders-pending'
+            params = {'instId': inst_id}
             
             try:
                 response = self.session.get(
                     self.base_url + path,
-                    headers=self.get_auth_headers("GET", path, demo=demo),
-                    timeout=30,
-                    verify=True
+                    params=params,
+                    headers=self.get_auth_headers("GET", f"{path}?{urlencode(params)}", demo=demo),
+                    timeout=30
                 )
-                data = response.json()
+                data = self._parse(response)
             except requests.exceptions.SSLError as e:
-                logger.error(f"SSL ошибка при получении активных ордеров: {e}")
+                logger.error("SSL ошибка при получении активных ордеров: {}", e)
                 raise
             except requests.exceptions.RequestException as e:
-                logger.error(f"Ошибка сети при получении активных ордеров: {e}")
+                logger.error("Ошибка сети при получении активных ордеров: {}", e)
                 raise
             
-            logger.info(f"Активные ордера для {inst_id} успешно получены")
+            logger.info("Активные ордера для {} успешно получены", inst_id)
             return data
             
         except Exception as e:
-            logger.error(f"Ошибка получения активных ордеров: {e}")
+            logger.error("Ошибка получения активных ордеров: {}", e)
             return {
                 "code": "1",
                 "msg": f"Ошибка получения активных ордеров: {e}",
@@ -999,6 +1306,92 @@ class OKXService:
             }
 
 
+    def get_order_details(self, inst_id: str, ord_id: str, demo: bool = False) -> Dict:
+        """
+        Получение информации об ордере
+        
+        Args:
+            inst_id: Инструмент
+            ord_id: ID ордера
+            demo: Режим демо-трейдинга
+            
+        Returns:
+            Dict: Данные ордера (accFillSz, avgPx, fee, feeCcy, state и т.д.)
+        """
+        try:
+            logger.info("Получение информации об ордере {} на инструменте {}", ord_id, inst_id)
+            
+            path = '/api/v5/trade/order'
+            params = {'instId': inst_id, 'ordId': ord_id}
+            
+            try:
+                response = self.session.get(
+                    self.base_url + path,
+                    params=params,
+                    headers=self.get_auth_headers("GET", f"{path}?{urlencode(params)}", demo=demo),
+                    timeout=30
+                )
+                data = self._parse(response)
+            except requests.exceptions.SSLError as e:
+                logger.error("SSL ошибка при получении ордера: {}", e)
+                raise
+            except requests.exceptions.RequestException as e:
+                logger.error("Ошибка сети при получении ордера: {}", e)
+                raise
+            
+            return data
+            
+        except Exception as e:
+            logger.error("Ошибка получения информации об ордере: {}", e)
+            return {
+                "code": "1",
+                "msg": f"Ошибка получения информации об ордере: {e}",
+                "data": []
+            }
+    
+    def _get_filled_size(self, inst_id: str, ord_id: str, demo: bool = False) -> Tuple[float, float]:
+        """
+        Определение исполненного объема ордера за вычетом комиссии в базовой валюте
+        
+        Основной источник - данные ордера (accFillSz, avgPx). Если ордер еще
+        не отражает исполнение, объем суммируется по сделкам ордера.
+        Пока оба источника пусты, запрос повторяется до _FILL_POLL_ATTEMPTS раз
+        с паузой _FILL_POLL_DELAY секунд.
+        
+        Args:
+            inst_id: Инструмент
+            ord_id: ID ордера
+            demo: Режим демо-трейдинга
+            
+        Returns:
+            Tuple[float, float]: (полученный объем базовой валюты, средняя цена или 0)
+        """
+        base_ccy = inst_id.split("-")[0]
+        
+        for attempt in range(_FILL_POLL_ATTEMPTS):
+            if attempt:
+                time.sleep(_FILL_POLL_DELAY)
+            
+            order = self.get_order_details(inst_id, ord_id, demo=demo)
+            order_data = (order.get("data") or [{}])[0]
+            filled = float(order_data.get("accFillSz") or 0)
+            if filled > 0:
+                # Комиссия отрицательная; при покупке она списывается в базовой валюте
+                if order_data.get("feeCcy") == base_ccy:
+                    filled += float(order_data.get("fee") or 0)
+                return round(filled, 8), float(order_data.get("avgPx") or 0)
+            
+            logger.warning("accFillSz пуст для ордера {}, используем сделки ордера (попытка {})", ord_id, attempt + 1)
+            fills = self.get_trade_fills(inst_id=inst_id, ord_id=ord_id, demo=demo).get("fills", [])
+            filled = sum(
+                float(fill.get("fillSz") or 0) + (float(fill.get("fee") or 0) if fill.get("feeCcy") == base_ccy else 0)
+                for fill in fills
+            )
+            if filled > 0:
+                return round(filled, 8), 0.0
+        
+        return 0.0, 0.0
+    
     def buy_btc_with_exits(
         self, 
         buy_amount: float, 
@@ -1009,17 +1402,14 @@ class OKXService:
     ) -> dict:
         try:
             logger.info("=== ПОКУПКА BTC С ТОЧКАМИ ВЫХОДА ===")
-            logger.info(f"Сумма покупки: {buy_amount} USDT")
-            logger.info(f"Инструмент: {inst_id}")
-            logger.info(f"Take Profit: {take_profit_percent}%")
-            logger.info(f"Stop Loss: {stop_loss_percent}%")
-            logger.info(f"Demo mode: {demo}")
-
-            btc_before = self.get_balance("BTC", demo=demo)
-            logger.info(f"Баланс BTC до покупки: {btc_before}")
+            logger.info("Сумма покупки: {} USDT", buy_amount)
+            logger.info("Инструмент: {}", inst_id)
+            logger.info("Take Profit: {}%", take_profit_percent)
+            logger.info("Stop Loss: {}%", stop_loss_percent)
+            logger.info("Demo mode: {}", demo)
 
             buy_result = self.place_market_order("buy", buy_amount, inst_id, demo=demo)
-            logger.info(f"Buy result: {buy_result}")
+            logger.info("Buy result: {}", buy_result)
 
             if buy_result.get("code") != "0":
                 return {
@@ -1035,25 +1425,41 @@ class OKXService:
                     "message": f"Ошибка покупки: {buy_result.get('msg', 'Неизвестная ошибка')}"
                 }
 
-            btc_after = self.get_balance("BTC", demo=demo)
-            btc_acquired = round(btc_after - btc_before, 8)  # Round to match OKX precision
-            logger.info(f"Баланс BTC после покупки: {btc_after}")
-            logger.info(f"Получено BTC: {btc_acquired}")
+            # Объем и цену берем из исполнения ордера, а не из разницы балансов (минус два запроса)
+            ord_id = buy_result["data"][0]["ordId"]
+            btc_acquired, avg_px = self._get_filled_size(inst_id, ord_id, demo=demo)
+            logger.info("Получено BTC: {}", btc_acquired)
 
             if btc_acquired <= 0:
-                raise ValueError("BTC не был получен после покупки.")
+                # Ордер принят биржей, но исполнение не подтвердилось: покупку не считаем неудачной,
+                # а явно сообщаем, что точки выхода не выставлены
+                logger.error("Исполненный объем ордера {} не подтвержден, TP и SL не установлены", ord_id)
+                not_placed = {"error": "Исполненный объем не подтвержден, ордер не установлен"}
+                return {
+                    "success": False,
+                    "buy_amount": buy_amount,
+                    "current_price": 0,
+                    "take_profit_price": 0,
+                    "stop_loss_price": 0,
+                    "buy_order": buy_result,
+                    "take_profit_order": not_placed,
+                    "stop_loss_order": not_placed,
+                    "btc_acquired": 0,
+                    "message": f"Ордер на покупку {ord_id} выставлен, но исполненный объем не подтвержден: "
+                               "TP и SL не установлены, проверьте ордер вручную"
+                }
 
-            actual_price = buy_amount / btc_acquired
-            logger.info(f"Фактическая цена покупки: {actual_price}")
+            actual_price = avg_px or buy_amount / btc_acquired
+            logger.info("Фактическая цена покупки: {}", actual_price)
 
             take_profit_price = round(actual_price * (1 + take_profit_percent / 100))
             stop_loss_price = round(actual_price * (1 - stop_loss_percent / 100))
-            logger.info(f"Рассчитанный Take Profit: {take_profit_price}")
-            logger.info(f"Рассчитанный Stop Loss: {stop_loss_price}")
+            logger.info("Рассчитанный Take Profit: {}", take_profit_price)
+            logger.info("Рассчитанный Stop Loss: {}", stop_loss_price)
 
             # Минимальный размер (из доков OKX для BTC-USDT spot: 0.00001 BTC)
             min_size = 0.00001
-            logger.info(f"Минимальный размер ордера: {min_size}")
+            logger.info("Минимальный размер ордера: {}", min_size)
 
             take_profit_result = {"code": "1", "msg": "TP ордер не установлен — слишком мал размер", "data": []}
             stop_loss_result = {"code": "1", "msg": "SL ордер не установлен — слишком мал размер", "data": []}
@@ -1066,7 +1472,7 @@ class OKXService:
                     price=take_profit_price,
                     demo=demo
                 )
-                logger.info(f"Результат TP ордера: {take_profit_result}")
+                logger.info("Результат TP ордера: {}", take_profit_result)
 
                 stop_loss_result = self.place_stop_loss_order(
                     inst_id=inst_id,
@@ -1074,9 +1480,9 @@ class OKXService:
                     trigger_price=stop_loss_price,
                     demo=demo
                 )
-                logger.info(f"Результат SL ордера: {stop_loss_result}")
+                logger.info("Результат SL ордера: {}", stop_loss_result)
             else:
-                logger.warning(f"Получено слишком мало BTC ({btc_acquired}) для установки TP и SL ордеров.")
+                logger.warning("Получено слишком мало BTC ({}) для установки TP и SL ордеров.", btc_acquired)
 
             success = buy_result.get("code") == "0" and \
                     (take_profit_result.get("code") == "0" or "не установлен" in take_profit_result.get("msg", "").lower()) and \
@@ -1087,7 +1493,7 @@ class OKXService:
             else:
                 message = "Покупка выполнена, но не все ордера установлены"
 
-            logger.info(f"Результат: {message}")
+            logger.info("Результат: {}", message)
 
             return {
                 "success": success,
@@ -1103,7 +1509,7 @@ class OKXService:
             }
 
         except Exception as e:
-            logger.error(f"Ошибка покупки BTC с точками выхода: {e}", exc_info=True)
+            logger.exception("Ошибка покупки BTC с точками выхода: {}", e)
             return {
                 "success": False,
                 "buy_amount": buy_amount,
@@ -1128,36 +1534,27 @@ class OKXService:
         demo: bool = False
     ) -> dict:
         try:
-            body = {
-                "instId": inst_id,
-                "tdMode": "cash",
-                "side": side,
-                "ordType": "limit",
-                "sz": f"{size:.8f}",  # Fixed: decimal format
-                "px": str(price)
-            }
-            
-            import json
-            body_str = json.dumps(body, separators=(",", ":"))
-            logger.info(f"{side.upper()} LIMIT BODY: {body_str}")
+            # Одни и те же байты идут и в подпись, и в тело запроса
+            body_bytes = _limit_order_body(inst_id, side, size, price)
+            logger.info("{} LIMIT BODY: {}", side.upper(), body_bytes.decode())
             
-            headers = self.get_auth_headers("POST", "/api/v5/trade/order", body_str, demo=demo)
-            logger.info(f"{side.upper()} LIMIT HEADERS: {headers}")
+            headers = self.get_auth_headers("POST", "/api/v5/trade/order", body_bytes, demo=demo)
+            logger.debug("{} LIMIT HEADERS: {}", side.upper(), headers)
             
             response = self.session.post(
                 f"{self.base_url}/api/v5/trade/order",
                 headers=headers,
-                data=body_str,
+                data=body_bytes,
                 timeout=10
             )
             
-            result = response.json()
-            logger.info(f"{side.upper()} LIMIT ORDER RESULT: {result}")
+            result = self._parse(response)
+            logger.info("{} LIMIT ORDER RESULT: {}", side.upper(), result)
             
             return result
             
         except Exception as e:
-            logger.error(f"Ошибка размещения LIMIT ордера: {e}")
+            logger.error("Ошибка размещения LIMIT ордера: {}", e)
             return {"error": str(e)}
 
     def place_stop_loss_order(
@@ -1168,41 +1565,31 @@ class OKXService:
         demo: bool = False
     ) -> dict:
         try:
-            body = {
-                "instId": inst_id,
-                "tdMode": "cash",
-                "side": "sell",
-                "ordType": "trigger",
-                "triggerPx": str(trigger_price),
-                "triggerPxType": "last",
-                "orderPx": str(trigger_price),
-                "sz": f"{size:.8f}"  # Fixed: decimal format
-            }
-            
-            import json
-            body_str = json.dumps(body, separators=(",", ":"))
-            logger.info(f"STOP LOSS BODY: {body_str}")
+            # Одни и те же байты идут и в подпись, и в тело запроса
+            body_bytes = _stop_loss_order_body(inst_id, size, trigger_price)
+            logger.info("STOP LOSS BODY: {}", body_bytes.decode())
             
-            headers = self.get_auth_headers("POST", "/api/v5/trade/order-algo", body_str, demo=demo)
-            logger.info(f"STOP LOSS HEADERS: {headers}")
+            headers = self.get_auth_headers("POST", "/api/v5/trade/order-algo", body_bytes, demo=demo)
+            logger.debug("STOP LOSS HEADERS: {}", headers)
             
             response = self.session.post(
                 f"{self.base_url}/api/v5/trade/order-algo",
                 headers=headers,
-                data=body_str,
+                data=body_bytes,
                 timeout=10
             )
             
-            result = response.json()
-            logger.info(f"STOP LOSS ORDER RESULT: {result}")
+            result = self._parse(response)
+            logger.info("STOP LOSS ORDER RESULT: {}", result)
             
             return result
             
         except Exception as e:
-            logger.error(f"Ошибка создания Stop Loss ордера: {e}")
+            logger.error("Ошибка создания Stop Loss ордера: {}", e)
             return {"error": str(e)}
 
 
+    @_ttl_cache(0.5)
     def get_ticker_data(self, inst_id: str = "BTC-USDT") -> dict:
         """
         Получение данных тикера
@@ -1214,41 +1601,37 @@ class OKXService:
             dict: Данные тикера
         """
         try:
-            logger.info(f"Получение данных тикера для {inst_id}")
-            
-            path = f'/api/v5/market/ticker?instId={inst_id}'
+            logger.info("Получение данных тикера для {}", inst_id)
             
             try:
-                response = self.session.get(
-                    self.base_url + path,
-                    timeout=30,
-                    verify=True
-                )
-                result = response.json()
+                result = self._get_json('/api/v5/market/ticker', {'instId': inst_id})
             except requests.exceptions.SSLError as e:
-                logger.error(f"SSL ошибка при получении тикера: {e}")
+                logger.error("SSL ошибка при получении тикера: {}", e)
                 return {"success": False, "error": f"SSL ошибка: {e}"}
             except requests.exceptions.RequestException as e:
-                logger.error(f"Ошибка сети при получении тикера: {e}")
+                logger.error("Ошибка сети при получении тикера: {}", e)
                 return {"success": False, "error": f"Ошибка сети: {e}"}
             
-            logger.info(f"TICKER DATA RESULT: {result}")
+            logger.debug("TICKER DATA RESULT: {}", result)
             
             # Проверяем успешность запроса
             if result.get("code") == "0" and result.get("data") and len(result["data"]) > 0:
                 return {"success": True, "data": result["data"][0]}
             else:
-                logger.error(f"Ошибка API тикера: {result}")
+                logger.error("Ошибка API тикера: {}", result)
                 return {"success": False, "error": result.get("msg", "Неизвестная ошибка")}
             
         except Exception as e:
-            logger.error(f"Ошибка получения данных тикера: {e}")
+            logger.error("Ошибка получения данных тикера: {}", e)
             return {"success": False, "error": str(e)}
 
 
+    @_ttl_cache(0.5)
     def get_market_analytics(
         self, 
-        demo: bool = False
+        demo: bool = False,
+        parallel: bool = True,
+        cache: bool = True
     ) -> Dict:
         """
         Получение полных аналитических данных по BTC для всех таймфреймов
@@ -1263,14 +1646,16 @@ class OKXService:
         
         Args:
             demo: Режим демо-трейдинга
+            parallel: Выполнять запросы параллельно (False - последовательно)
+            cache: False - получить свежие данные в обход кэшей стакана, тикера и свечей
             
         Returns:
             Dict: Полные аналитические данные по всем таймфреймам BTC
         """
         try:
             inst_id = "BTC-USDT"
-            logger.info(f"=== НАЧАЛО ПОЛУЧЕНИЯ АНАЛИТИКИ ПО BTC ДЛЯ ВСЕХ ТАЙМФРЕЙМОВ ===")
-            logger.info(f"Режим: {'DEMO' if demo else 'LIVE'}")
+            logger.info("=== НАЧАЛО ПОЛУЧЕНИЯ АНАЛИТИКИ ПО BTC ДЛЯ ВСЕХ ТАЙМФРЕЙМОВ ===")
+            logger.info("Режим: {}", 'DEMO' if demo else 'LIVE')
             
             # Конфигурация таймфреймов
             timeframes = {
@@ -1282,30 +1667,37 @@ class OKXService:
                 "1D": 90    # OKX использует 1D, не 1d
             }
             
-            # Получаем общие данные
-            logger.info("Получение orderbook...")
-            orderbook = self.get_orderbook(inst_id, 20)  # Фиксированная глубина 20
-            logger.info(f"Orderbook получен: {len(orderbook.get('data', []))} записей")
+            # Все запросы независимы, поэтому выполняются параллельно: ~1 RTT вместо суммы.
+            # Методы-получатели сами перехватывают ошибки, так что сбой одного не ломает остальные
+            logger.info("Получение orderbook, active_orders, balances, ticker и свечей...")
+            with ThreadPoolExecutor(max_workers=4 + len(timeframes) if parallel else 1) as executor:
+                orderbook_future = executor.submit(self.get_orderbook, inst_id, 20, cache=cache)  # Фиксированная глубина 20
+                active_orders_future = executor.submit(self.get_active_orders, inst_id, demo=demo)
+                balances_future = executor.submit(self.get_balances, demo=demo)
+                ticker_future = executor.submit(self.get_ticker_data, inst_id, cache=cache)
+                candles_futures = {
+                    timeframe: executor.submit(self.get_current_candles, inst_id, timeframe, bars_count, cache=cache)
+                    for timeframe, bars_count in timeframes.items()
+                }
             
-            logger.info("Получение active_orders...")
-            active_orders = self.get_active_orders(inst_id, demo=demo)
-            logger.info(f"Active orders получены: {len(active_orders.get('data', []))} записей")
+            orderbook = orderbook_future.result()
+            logger.info("Orderbook получен: {} записей", len(orderbook.get('data', [])))
             
-            logger.info("Получение balances...")
-            balances = self.get_balances(demo=demo)
-            logger.info(f"Balances получены: {balances.get('success', False)}")
+            active_orders = active_orders_future.result()
+            logger.info("Active orders получены: {} записей", len(active_orders.get('data', [])))
             
-            logger.info("Получение ticker...")
-            ticker = self.get_ticker_data(inst_id)
-            logger.info(f"Ticker получен: {ticker.get('success', False)}")
+            balances = balances_future.result()
+            logger.info("Balances получены: {}", balances.get('success', False))
             
-            # Получаем свечи для всех таймфреймов
+            ticker = ticker_future.result()
+            logger.info("Ticker получен: {}", ticker.get('success', False))
+            
+            # Свечи для всех таймфреймов
             candles_data = {}
-            for timeframe, bars_count in timeframes.items():
-                logger.info(f"Получение свечей для {timeframe} ({bars_count} баров)...")
-                candles = self.get_current_candles(inst_id, timeframe, bars_count)
+            for timeframe, future in candles_futures.items():
+                candles = future.result()
                 candles_data[timeframe] = candles.get("data", []) if candles.get("success") else []
-                logger.info(f"Свечи {timeframe} получены: {len(candles_data[timeframe])} записей")
+                logger.info("Свечи {} получены: {} записей", timeframe, len(candles_data[timeframe]))
             
             # Создаем структуру результата
             result = {
@@ -1346,22 +1738,22 @@ class OKXService:
                     "high_24h": ticker_data.get("high24h", "0"),
                     "low_24h": ticker_data.get("low24h", "0")
                 }
-                logger.info(f"Индикаторы извлечены: {result['indicators']}")
+                logger.info("Индикаторы извлечены: {}", result['indicators'])
             else:
-                logger.warning(f"Ticker не содержит данных: {ticker}")
+                logger.warning("Ticker не содержит данных: {}", ticker)
             
-            logger.info(f"=== АНАЛИТИКА ПО BTC ЗАВЕРШЕНА ===")
-            logger.info(f"Получено таймфреймов: {len(candles_data)}")
+            logger.info("=== АНАЛИТИКА ПО BTC ЗАВЕРШЕНА ===")
+            logger.info("Получено таймфреймов: {}", len(candles_data))
             for tf, data in candles_data.items():
-                logger.info(f"  {tf}: {len(data)} баров")
+                logger.info("  {}: {} баров", tf, len(data))
             
             return result
             
         except Exception as e:
-            logger.error(f"Ошибка получения аналитических данных: {e}")
-            logger.error(f"Тип ошибки: {type(e)}")
+            logger.error("Ошибка получения аналитических данных: {}", e)
+            logger.error("Тип ошибки: {}", type(e))
             import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.error("Traceback: {}", traceback.format_exc())
             return {
                 "success": False,
                 "inst_id": "BTC-USDT",
@@ -1385,7 +1777,7 @@ class OKXService:
             }
 
 
-    def get_quick_monitor(self, demo: bool = False) -> Dict:
+    def get_quick_monitor(self, demo: bool = False, parallel: bool = True) -> Dict:
         """
         Быстрый мониторинг BTC для n8n с минимальным набором данных
         
@@ -1398,35 +1790,39 @@ class OKXService:
         
         Args:
             demo: Режим демо-трейдинга
+            parallel: Выполнять запросы параллельно (False - последовательно)
             
         Returns:
             Dict: Мониторинговые данные
         """
         try:
             inst_id = "BTC-USDT"
-            logger.info(f"=== БЫСТРЫЙ МОНИТОРИНГ BTC ===")
-            logger.info(f"Режим: {'DEMO' if demo else 'LIVE'}")
+            logger.info("=== БЫСТРЫЙ МОНИТОРИНГ BTC ===")
+            logger.info("Режим: {}", 'DEMO' if demo else 'LIVE')
+            
+            # Получаем только самые необходимые данные; запросы независимы и идут параллельно
+            logger.info("Получение 10 свечей 1m, orderbook, active_orders, balances и ticker...")
+            with ThreadPoolExecutor(max_workers=5 if parallel else 1) as executor:
+                candles_1m_future = executor.submit(self.get_current_candles, inst_id, "1m", 10)
+                orderbook_future = executor.submit(self.get_orderbook, inst_id, 20)  # Фиксированная глубина 20
+                active_orders_future = executor.submit(self.get_active_orders, inst_id, demo=demo)
+                balances_future = executor.submit(self.get_balances, demo=demo)
+                ticker_future = executor.submit(self.get_ticker_data, inst_id)
             
-            # Получаем только самые необходимые данные
-            logger.info("Получение 10 свечей 1m...")
-            candles_1m = self.get_current_candles(inst_id, "1m", 10)
-            logger.info(f"Свечи 1m получены: {len(candles_1m.get('data', []))} записей")
+            candles_1m = candles_1m_future.result()
+            logger.info("Свечи 1m получены: {} записей", len(candles_1m.get('data', [])))
             
-            logger.info("Получение orderbook...")
-            orderbook = self.get_orderbook(inst_id, 20)  # Фиксированная глубина 20
-            logger.info(f"Orderbook получен: {len(orderbook.get('data', []))} записей")
+            orderbook = orderbook_future.result()
+            logger.info("Orderbook получен: {} записей", len(orderbook.get('data', [])))
             
-            logger.info("Получение active_orders...")
-            active_orders = self.get_active_orders(inst_id, demo=demo)
-            logger.info(f"Active orders получены: {len(active_orders.get('data', []))} записей")
+            active_orders = active_orders_future.result()
+            logger.info("Active orders получены: {} записей", len(active_orders.get('data', [])))
             
-            logger.info("Получение balances...")
-            balances = self.get_balances(demo=demo)
-            logger.info(f"Balances получены: {balances.get('success', False)}")
+            balances = balances_future.result()
+            logger.info("Balances получены: {}", balances.get('success', False))
             
-            logger.info("Получение ticker...")
-            ticker = self.get_ticker_data(inst_id)
-            logger.info(f"Ticker получен: {ticker.get('success', False)}")
+            ticker = ticker_future.result()
+            logger.info("Ticker получен: {}", ticker.get('success', False))
             
             # Создаем структуру результата
             result = {
@@ -1463,20 +1859,20 @@ class OKXService:
                     "high_24h": ticker_data.get("high24h", "0"),
                     "low_24h": ticker_data.get("low24h", "0")
                 }
-                logger.info(f"Индикаторы извлечены: {result['indicators']}")
+                logger.info("Индикаторы извлечены: {}", result['indicators'])
             else:
-                logger.warning(f"Ticker не содержит данных: {ticker}")
+                logger.warning("Ticker не содержит данных: {}", ticker)
             
-            logger.info(f"=== МОНИТОРИНГ BTC ЗАВЕРШЕН ===")
-            logger.info(f"Получено: 1m свечей: {len(result['candles_1m'])}, ордеров: {len(result['active_orders'])}")
+            logger.info("=== МОНИТОРИНГ BTC ЗАВЕРШЕН ===")
+            logger.info("Получено: 1m свечей: {}, ордеров: {}", len(result['candles_1m']), len(result['active_orders']))
             
             return result
             
         except Exception as e:
-            logger.error(f"Ошибка быстрого мониторинга: {e}")
-            logger.error(f"Тип ошибки: {type(e)}")
+            logger.error("Ошибка быстрого мониторинга: {}", e)
+            logger.error("Тип ошибки: {}", type(e))
             import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.error("Traceback: {}", traceback.format_exc())
             return {
                 "success": False,
                 "inst_id": "BTC-USDT",
@@ -3,10 +3,12 @@
 Скрипт для мониторинга состояния FastAPI сервера
 """
 
+import asyncio
+import socket
 import requests
 import psutil
-import time
 from datetime import datetime
+from typing import Optional
 from loguru import logger
 
 def check_server_health(server_url: str = "http://109.73.192.126:8001"):
@@ -49,26 +51,57 @@ def check_system_resources():
         "processes": len(psutil.pids())
     }
 
+# Найденный процесс FastAPI, чтобы не перебирать все процессы на каждой проверке.
+# Тот же объект Process также дает осмысленный cpu_percent() между проверками
+_cached_proc: Optional[psutil.Process] = None
+
+def _process_info(proc: psutil.Process):
+    """Сбор информации о процессе"""
+    
+    return {
+        "found": True,
+        "pid": proc.pid,
+        "memory_mb": proc.memory_info().rss / 1024 / 1024,
+        "cpu_percent": proc.cpu_percent(),
+        "status": proc.status()
+    }
+
 def check_fastapi_process():
     """Проверка процесса FastAPI"""
     
-    for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+    global _cached_proc
+    
+    if _cached_proc is not None:
         try:
-            cmdline = ' '.join(proc.info['cmdline'])
+            if _cached_proc.is_running():
+                return _process_info(_cached_proc)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+        _cached_proc = None
+    
+    for proc in psutil.process_iter(['pid', 'cmdline']):
+        try:
+            cmdline = ' '.join(proc.info['cmdline'] or [])
             if 'app.main' in cmdline or 'uvicorn' in cmdline:
-                return {
-                    "found": True,
-                    "pid": proc.info['pid'],
-                    "memory_mb": proc.memory_info().rss / 1024 / 1024,
-                    "cpu_percent": proc.cpu_percent(),
-                    "status": proc.status()
-                }
+                info = _process_info(proc)
+                _cached_proc = proc
+                return info
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             continue
     
     return {"found": False}
 
-def monitor_server(interval: int = 30):
+def check_port(port: int = 8001):
+    """Проверка доступности порта"""
+    
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.settimeout(5)
+    try:
+        return sock.connect_ex(('localhost', port)) == 0
+    finally:
+        sock.close()
+
+async def monitor_server(interval: int = 30):
     """Мониторинг сервера с заданным интервалом"""
     
     print(f"🔍 Запуск мониторинга сервера (интервал: {interval} сек)")
@@ -79,23 +112,37 @@ def monitor_server(interval: int = 30):
         print(f"\n📊 Проверка {timestamp}")
         print("-" * 40)
         
+        # Все проверки блокирующие и независимые: выполняем их параллельно в потоках,
+        # чтобы секунда замера CPU перекрывалась с HTTP-запросом и проверкой порта
+        health, resources, process, port_open = await asyncio.gather(
+            asyncio.to_thread(check_server_health),
+            asyncio.to_thread(check_system_resources),
+            asyncio.to_thread(check_fastapi_process),
+            asyncio.to_thread(check_port, 8001),
+            return_exceptions=True
+        )
+        
         # Проверка здоровья сервера
-        health = check_server_health()
-        if health["status"] == "healthy":
+        if isinstance(health, Exception):
+            print(f"❌ Проблема с сервером: {health}")
+        elif health["status"] == "healthy":
             print(f"✅ Сервер здоров (ответ: {health['response_time']:.3f}s)")
         else:
             print(f"❌ Проблема с сервером: {health}")
         
         # Проверка системных ресурсов
-        resources = check_system_resources()
-        print(f"💻 CPU: {resources['cpu_percent']:.1f}%")
-        print(f"🧠 RAM: {resources['memory_percent']:.1f}%")
-        print(f"💾 Disk: {resources['disk_percent']:.1f}%")
-        print(f"🌐 Соединения: {resources['network_connections']}")
+        if isinstance(resources, Exception):
+            print(f"⚠️ Ошибка проверки ресурсов: {resources}")
+        else:
+            print(f"💻 CPU: {resources['cpu_percent']:.1f}%")
+            print(f"🧠 RAM: {resources['memory_percent']:.1f}%")
+            print(f"💾 Disk: {resources['disk_percent']:.1f}%")
+            print(f"🌐 Соединения: {resources['network_connections']}")
         
         # Проверка процесса FastAPI
-        process = check_fastapi_process()
-        if process["found"]:
+        if isinstance(process, Exception):
+            print(f"⚠️ Ошибка проверки процесса: {process}")
+        elif process["found"]:
             print(f"🔧 FastAPI процесс: PID {process['pid']}")
             print(f"   Память: {process['memory_mb']:.1f} MB")
             print(f"   CPU: {process['cpu_percent']:.1f}%")
@@ -104,28 +151,21 @@ def monitor_server(interval: int = 30):
             print("❌ FastAPI процесс не найден!")
         
         # Проверка порта 8001
-        try:
-            import socket
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(5)
-            result = sock.connect_ex(('localhost', 8001))
-            sock.close()
-            
-            if result == 0:
-                print("✅ Порт 8001 открыт")
-            else:
-                print("❌ Порт 8001 закрыт")
-        except Exception as e:
-            print(f"⚠️ Ошибка проверки порта: {e}")
+        if isinstance(port_open, Exception):
+            print(f"⚠️ Ошибка проверки порта: {port_open}")
+        elif port_open:
+            print("✅ Порт 8001 открыт")
+        else:
+            print("❌ Порт 8001 закрыт")
         
         print("-" * 40)
         print(f"⏰ Следующая проверка через {interval} секунд...")
         
-        time.sleep(interval)
+        await asyncio.sleep(interval)
 
 if __name__ == "__main__":
     try:
-        monitor_server()
+        asyncio.run(monitor_server())
     except KeyboardInterrupt:
         print("\n🛑 Мониторинг остановлен пользователем")
     except Exception as e:
@@ -1,37 +1,124 @@
+import asyncio
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import hmac
 import base64
-import json
+import orjson
+import websockets
+from websockets.exceptions import WebSocketException
 import time
-from datetime import datetime, timezone
+from urllib.parse import urlparse
 
-# === Конфигурация ===
-api_key = 'a018bfb8-1997-45db-af2e-6299bff03309'
-secret_key = 'F04F7FE72491CB39E1DB88F352B82332'
-passphrase = '62015326495Fred@'
+from app.core.config import settings
+
+# === Конфигурация: те же настройки, что и у приложения (.env или переменные окружения, см. env.example) ===
+api_key = settings.okx_api_key
+secret_key = settings.okx_api_secret
+passphrase = settings.okx_passphrase
+
+_missing = [
+    name for name, value in (
+        ('OKX_API_KEY', api_key),
+        ('OKX_API_SECRET', secret_key),
+        ('OKX_PASSPHRASE', passphrase)
+    ) if not value
+]
+if _missing:
+    raise SystemExit(f"Не заданы учетные данные OKX: {', '.join(_missing)} (укажите в .env или экспортируйте)")
 
 BASE_URL = 'https://www.okx.com'
+WS_PUBLIC_URL = 'wss://wspap.okx.com:8443/ws/v5/public'  # Демо; для боевого режима wss://ws.okx.com:8443/ws/v5/public
+
+# Постоянные заголовки авторизации; Content-Type и x-simulated-trading заданы в SESSION
+BASE_HEADERS = {
+    'OK-ACCESS-KEY': api_key,
+    'OK-ACCESS-PASSPHRASE': passphrase
+}
+
+# Одна сессия на весь скрипт: TLS-соединение с OKX переиспользуется между запросами
+SESSION = requests.Session()
+# Повторяем только GET: повтор POST ордера может выставить его дважды
+RETRY = Retry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(['GET']),
+    respect_retry_after_header=True
+)
+ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=RETRY)
+SESSION.mount('https://', ADAPTER)
+SESSION.mount('http://', ADAPTER)
+SESSION.headers.update({
+    'Content-Type': 'application/json',
+    'x-simulated-trading': '1'  # Удали если работаешь в боевом режиме
+})
+
+# Таймаут ордеров не адаптивный: обрыв POST оставит неизвестным, исполнен ли ордер,
+# а повтор не выполняется. Запас на медленный ответ торгового движка
+ORDER_TIMEOUT = (3.05, 30)
+
+class RTTEstimator:
+    """Оценка RTT до хоста и таймаута по RFC 6298 (Jacobson/Karels); только для GET"""
+
+    def __init__(self, default_timeout=10.0):
+        self.srtt = None
+        self.rttvar = None
+        self.default_timeout = default_timeout
+
+    def observe(self, rtt):
+        if self.srtt is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar = 0.75 * self.rttvar + 0.25 * abs(self.srtt - rtt)
+            self.srtt = 0.875 * self.srtt + 0.125 * rtt
+
+    def timeout(self):
+        if self.srtt is None:
+            return self.default_timeout
+        return max(1.0, min(30.0, self.srtt + 4 * self.rttvar))
+
+
+# Оценщики RTT по хостам
+RTT_ESTIMATORS = {}
+
+def get_estimator(url):
+    host = urlparse(url).netloc
+    if host not in RTT_ESTIMATORS:
+        RTT_ESTIMATORS[host] = RTTEstimator()
+    return RTT_ESTIMATORS[host]
+
+# Префикс метки времени с точностью до секунды: (секунда, 'YYYY-MM-DDTHH:MM:SS')
+_TS_CACHE = (0, "")
 
 def get_timestamp():
-    return datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+    global _TS_CACHE
+    secs, ms = divmod(time.time_ns() // 1_000_000, 1000)
+    cached_secs, prefix = _TS_CACHE
+    if secs != cached_secs:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(secs))
+        _TS_CACHE = (secs, prefix)
+    return f'{prefix}.{ms:03d}Z'
+
+def _make_signer(secret: bytes):
+    """Функция подписи с ключом HMAC, инициализированным один раз"""
+    template = hmac.new(secret, b'', 'sha256')
+
+    def sign(message: bytes):
+        h = template.copy()
+        h.update(message)
+        return base64.b64encode(h.digest()).decode()
+
+    return sign
 
-def sign(message, secret_key):
-    return base64.b64encode(
-        hmac.new(secret_key.encode(), message.encode(), digestmod='sha256').digest()
-    ).decode()
+sign = _make_signer(secret_key.encode())
 
-def get_headers(method, path, body=""):
+def get_headers(method, path, body=b""):
     timestamp = get_timestamp()
-    message = f'{timestamp}{method}{path}{body}'
-    signature = sign(message, secret_key)
-    return {
-        'OK-ACCESS-KEY': api_key,
-        'OK-ACCESS-SIGN': signature,
-        'OK-ACCESS-TIMESTAMP': timestamp,
-        'OK-ACCESS-PASSPHRASE': passphrase,
-        'Content-Type': 'application/json',
-        'x-simulated-trading': '1'  # Удали если работаешь в боевом режиме
-    }
+    message = f'{timestamp}{method}{path}'.encode() + body
+    signature = sign(message)
+    return {**BASE_HEADERS, 'OK-ACCESS-SIGN': signature, 'OK-ACCESS-TIMESTAMP': timestamp}
 
 def place_market_order(side, notional):
     path = '/api/v5/trade/order'
@@ -44,30 +131,103 @@ def place_market_order(side, notional):
         "ccy": "USDT" if side == "buy" else "BTC",
         "sz": str(notional)
     }
-    body_str = json.dumps(body, separators=(",", ":"))
-    print(f"{side.upper()} BODY: {body_str}")  # 👈 debug print
-    headers = get_headers("POST", path, body_str)
-    r = requests.post(url, headers=headers, data=body_str)
+    body_bytes = orjson.dumps(body)
+    print(f"{side.upper()} BODY: {body_bytes.decode()}")  # 👈 debug print
+    headers = get_headers("POST", path, body_bytes)
+    r = SESSION.post(url, headers=headers, data=body_bytes, timeout=ORDER_TIMEOUT)
     print(f"{side.upper()} ORDER RESULT:", r.text)
-    return r.json()
+    return orjson.loads(r.content)
 
 
 def get_balance(ccy):
     path = f'/api/v5/account/balance?ccy={ccy}'
     url = BASE_URL + path
     headers = get_headers("GET", path)
-    r = requests.get(url, headers=headers)
-    data = r.json()
+    estimator = get_estimator(url)
+    r = SESSION.get(url, headers=headers, timeout=(3.05, estimator.timeout()))
+    estimator.observe(r.elapsed.total_seconds())
+    data = orjson.loads(r.content)
     return float(data['data'][0]['details'][0]['availBal'])
 
-# === Шаг 1: Купить на 100 USDT ===
-place_market_order("buy", notional=100)
+def get_last_price(inst_id="BTC-USDT"):
+    url = f'{BASE_URL}/api/v5/market/ticker?instId={inst_id}'
+    estimator = get_estimator(url)
+    r = SESSION.get(url, timeout=(3.05, estimator.timeout()))
+    estimator.observe(r.elapsed.total_seconds())
+    return float(orjson.loads(r.content)['data'][0]['last'])
+
+async def price_watch_loop(tp, sl, interval=5):
+    """Опрашивает цену, пока она не выйдет за TP/SL"""
+    while True:
+        try:
+            price = await asyncio.to_thread(get_last_price)
+        except (requests.RequestException, KeyError, IndexError, ValueError) as e:
+            print("Ошибка получения цены:", e)
+        else:
+            if price >= tp or price <= sl:
+                return price
+        await asyncio.sleep(interval)
+
+async def watch_price(inst_id, tp, sl):
+    """Ждёт выхода цены за TP/SL по подписке на канал tickers"""
+    subscribe = orjson.dumps({"op": "subscribe", "args": [{"channel": "tickers", "instId": inst_id}]})
+    async with websockets.connect(WS_PUBLIC_URL) as ws:
+        await ws.send(subscribe.decode())
+        async for msg in ws:
+            message = orjson.loads(msg)
+            if message.get('event') == 'error':
+                # Ошибка подписки приходит без data: без исключения ждали бы молча весь период
+                raise WebSocketException(f"Ошибка подписки: {message.get('code')} {message.get('msg')}")
+            data = message.get('data')
+            if not data:
+                continue  # подтверждение подписки
+            last = float(data[0]['last'])
+            if last >= tp or last <= sl:
+                return last
+    return None
+
+async def watch_price_with_fallback(tp, sl):
+    """WebSocket-подписка на цену, при обрыве - опрос REST"""
+    try:
+        price = await watch_price("BTC-USDT", tp, sl)
+        if price is not None:
+            return price
+    except (WebSocketException, OSError, KeyError, IndexError, ValueError) as e:
+        print("WebSocket недоступен, переходим на опрос REST:", e)
+    return await price_watch_loop(tp, sl)
+
+async def main():
+    # === Шаг 1: Купить на 100 USDT ===
+    await asyncio.to_thread(place_market_order, "buy", 100)
+    try:
+        entry = await asyncio.to_thread(get_last_price)
+    except (requests.RequestException, KeyError, IndexError, ValueError) as e:
+        # BTC уже куплен: без цены входа просто ждём и продаём по таймеру
+        print("Не удалось получить цену входа, TP/SL не отслеживаются:", e)
+        entry = None
 
-# === Шаг 2: Ждать 5 минут ===
-print("Ждём 5 минут...")
-time.sleep(300)
+    # === Шаг 2: Ждать 5 минут, следя за TP/SL ===
+    print("Ждём 5 минут...")
+    try:
+        if entry is None:
+            await asyncio.sleep(300)
+        else:
+            monitor = asyncio.create_task(watch_price_with_fallback(tp=1.05 * entry, sl=0.98 * entry))
+            timer = asyncio.create_task(asyncio.sleep(300))
+            try:
+                done, _ = await asyncio.wait({monitor, timer}, return_when=asyncio.FIRST_COMPLETED)
+                if monitor in done:
+                    if monitor.exception() is None:
+                        print(f"Цена вышла за TP/SL: {monitor.result()}")
+                    else:
+                        print("Слежение за ценой завершилось ошибкой, продаём по таймеру:", monitor.exception())
+                        await timer
+            finally:
+                monitor.cancel()
+                timer.cancel()
+    finally:
+        # === Шаг 3: Продать весь BTC ===
+        await asyncio.to_thread(place_market_order, "sell", 0.0009)
 
-# === Шаг 3: Продать весь BTC ===
-btc_balance = get_balance("BTC")
-place_market_order("sell", notional=0.0009)
-  # заменим notional на sz
+if __name__ == "__main__":
+    asyncio.run(main())